@@ -17,16 +17,29 @@ import sys
 import os
 
 # Add scripts directory to path
-sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT / 'scripts'))
 
 from airflow import DAG
+from airflow.operators.empty import EmptyOperator
 from airflow.operators.python import PythonOperator
 from airflow.operators.bash import BashOperator
 from airflow.utils.dates import days_ago
 
-# Import custom modules
-from data_ingestion import DataIngestion
-from validation_pipeline import ValidationPipeline
+# Import custom modules. ValidationPipeline (pandas, Great Expectations) is
+# imported inside validate_data so parsing the DAG stays cheap.
+from data_ingestion import raw_data_file
+from utils import load_config
+from deferrable_ingestion import DeferredDownloadOperator
+
+
+# Load configuration once at parse time. DataIngestion always writes to
+# <raw_data>/latest.csv (or latest.csv.gz), so the path is known up front and
+# does not need to travel between tasks through XCom.
+CONFIG_PATH = str(PROJECT_ROOT / 'config' / 'config.yaml')
+CONFIG = load_config(CONFIG_PATH)
+
+FILEPATH = raw_data_file(CONFIG)
 
 
 # Default arguments for the DAG
@@ -38,39 +51,32 @@ default_args = {
     'email_on_retry': False,
     'retries': 2,
     'retry_delay': timedelta(minutes=5),
+    'pool': 'default_pool',
 }
 
 
-def ingest_data(**context):
-    """Task function to ingest COVID-19 data."""
-    ingestion = DataIngestion()
-    filepath = ingestion.download_data()
-    
-    if not filepath or not ingestion.validate_download(filepath):
-        raise Exception("Data ingestion failed")
-        
-    # Push filepath to XCom for next task
-    context['ti'].xcom_push(key='data_filepath', value=filepath)
-    return filepath
-
-
 def validate_data(**context):
     """Task function to validate data with Great Expectations."""
-    # Get filepath from previous task
-    filepath = context['ti'].xcom_pull(key='data_filepath', task_ids='ingest_data')
+    from logging_config import configure_logging
+    from validation_pipeline import ValidationPipeline
+    
+    # No-op when Airflow has already configured the root logger
+    configure_logging(CONFIG)
     
     # Run validation pipeline
     pipeline = ValidationPipeline()
-    success = pipeline.run_pipeline(
-        filepath=filepath,
-        send_alerts=True,
-        load_to_db=True
-    )
+    try:
+        success = pipeline.run_pipeline(
+            filepath=FILEPATH,
+            send_alerts=True,
+            load_to_db=True
+        )
+    finally:
+        # Task runners leave through os._exit, so atexit hooks never run
+        pipeline.close()
     
     if not success:
         raise Exception("Data validation failed")
-        
-    return success
 
 
 def check_data_quality(**context):
@@ -78,7 +84,6 @@ def check_data_quality(**context):
     # This is a placeholder for additional quality checks
     # You can add custom business logic here
     print("Performing additional data quality checks...")
-    return True
 
 
 # Create DAG
@@ -89,15 +94,22 @@ dag = DAG(
     schedule_interval='0 2 * * *',  # Run daily at 2 AM
     start_date=days_ago(1),
     catchup=False,
+    max_active_tasks=4,  # Allow independent branches to run concurrently
     tags=['data-quality', 'covid19', 'great-expectations'],
 )
 
 
-# Task 1: Ingest data
-ingest_task = PythonOperator(
+# Entry point: independent branches fan out from here
+start = EmptyOperator(
+    task_id='start',
+    dag=dag,
+)
+
+
+# Task 1: Ingest data (deferred, so the network wait doesn't hold a worker slot)
+ingest_task = DeferredDownloadOperator(
     task_id='ingest_data',
-    python_callable=ingest_data,
-    provide_context=True,
+    config_path=CONFIG_PATH,
     dag=dag,
 )
 
@@ -106,7 +118,6 @@ ingest_task = PythonOperator(
 validate_task = PythonOperator(
     task_id='validate_data',
     python_callable=validate_data,
-    provide_context=True,
     dag=dag,
 )
 
@@ -115,7 +126,6 @@ validate_task = PythonOperator(
 quality_check_task = PythonOperator(
     task_id='check_data_quality',
     python_callable=check_data_quality,
-    provide_context=True,
     dag=dag,
 )
 
@@ -131,15 +141,22 @@ generate_docs_task = BashOperator(
 # Task 5: Cleanup old data (optional)
 cleanup_task = BashOperator(
     task_id='cleanup_old_data',
-    bash_command="""
-        # Keep only last 30 days of raw data
-        find {{ dag.folder }}/../data/raw -name "*.csv" -mtime +30 -delete
+    # Raw string so the shell's \( \) grouping is not a Python escape
+    bash_command=r"""
+        # Keep only last 30 days of raw data; never the live latest.* download,
+        # which ingest_data may be writing or validate_data reading right now
+        find {{ dag.folder }}/../data/raw \( -name "*.csv" -o -name "*.csv.gz" -o -name "*.meta.json" \) ! -name "latest.*" -mtime +30 -delete
         # Keep only last 7 days of quarantined data
-        find {{ dag.folder }}/../data/quarantine -name "*.csv" -mtime +7 -delete
+        find {{ dag.folder }}/../data/quarantine \( -name "*.csv" -o -name "*.csv.gz" \) -mtime +7 -delete
     """,
     dag=dag,
 )
 
 
 # Define task dependencies
-ingest_task >> validate_task >> quality_check_task >> [generate_docs_task, cleanup_task]
+# Cleanup only removes files older than the retention window and skips the
+# live latest.* download, so it does not need to wait for ingestion. Quality checks and Data Docs both depend only on
+# the validation output and can run side by side.
+start >> [ingest_task, cleanup_task]
+ingest_task >> validate_task
+validate_task >> [quality_check_task, generate_docs_task]
@@ -0,0 +1,112 @@
+"""
+Deferrable ingestion operator for the COVID-19 Data Quality DAG
+
+The download is almost entirely network wait, so instead of holding a worker
+slot for its whole duration the operator defers to a trigger that runs the
+download in the triggerer process. The worker only picks the task back up
+for the quick post-download file check.
+
+DataIngestion is a blocking client (requests, file writes, fsync), so the
+trigger runs it on a thread of the triggerer's default executor rather than
+on the event loop itself; it does not make the download asynchronous.
+
+The file is written to paths.raw_data on the triggerer host and read by the
+worker (and by validate_data), so that directory must be on storage shared
+by the triggerer and the workers. The worker checks that it sees the same
+file the trigger wrote and fails the task with an explanation otherwise.
+
+Author: Data Engineering Team
+Date: November 2025
+"""
+
+import asyncio
+import os
+import socket
+import sys
+from pathlib import Path
+
+# Add scripts directory to path (the triggerer imports this module on its own)
+sys.path.append(str(Path(__file__).parent.parent / 'scripts'))
+
+from airflow.exceptions import AirflowException
+from airflow.models import BaseOperator
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+from data_ingestion import DataIngestion
+
+
+class DownloadTrigger(BaseTrigger):
+    """Trigger that downloads the raw dataset in the triggerer process."""
+    
+    def __init__(self, config_path):
+        """
+        Initialize the trigger.
+        
+        Args:
+            config_path (str): Path to configuration file
+        """
+        super().__init__()
+        self.config_path = config_path
+        
+    def serialize(self):
+        """Return the classpath and kwargs used to rebuild the trigger."""
+        return (
+            f"{self.__class__.__module__}.{self.__class__.__name__}",
+            {'config_path': self.config_path},
+        )
+        
+    async def run(self):
+        """Run the blocking download in a thread so the event loop stays free."""
+        ingestion = DataIngestion(self.config_path)
+        filepath = await asyncio.to_thread(ingestion.download_data)
+        
+        # Describe the file as written here, so the worker can tell whether it
+        # is looking at the same storage
+        event = {'filepath': filepath, 'host': socket.gethostname()}
+        if filepath:
+            stat = os.stat(filepath)
+            event.update(size=stat.st_size, mtime=int(stat.st_mtime))
+        yield TriggerEvent(event)
+
+
+class DeferredDownloadOperator(BaseOperator):
+    """Operator that downloads the raw dataset without holding a worker slot."""
+    
+    def __init__(self, config_path, **kwargs):
+        """
+        Initialize the operator.
+        
+        Args:
+            config_path (str): Path to configuration file
+        """
+        super().__init__(**kwargs)
+        self.config_path = config_path
+        
+    def execute(self, context):
+        """Hand the download off to the triggerer."""
+        self.defer(
+            trigger=DownloadTrigger(self.config_path),
+            method_name='execute_complete',
+        )
+        
+    def execute_complete(self, context, event):
+        """Validate the downloaded file once the trigger fires."""
+        filepath = event.get('filepath')
+        if not filepath:
+            raise AirflowException("Data ingestion failed")
+            
+        try:
+            stat = os.stat(filepath)
+            same_file = (stat.st_size, int(stat.st_mtime)) == (event['size'], event['mtime'])
+        except FileNotFoundError:
+            same_file = False
+        if not same_file:
+            raise AirflowException(
+                f"{filepath} as seen on {socket.gethostname()} is not the file the "
+                f"triggerer on {event['host']} downloaded; paths.raw_data must be on "
+                "storage shared by the triggerer and the workers"
+            )
+            
+        ingestion = DataIngestion(self.config_path)
+        if not ingestion.validate_download(filepath):
+            raise AirflowException("Data ingestion failed")
@@ -26,12 +26,13 @@ from pathlib import Path
 # Add scripts directory to path
 sys.path.append('scripts')
 
-from data_ingestion import DataIngestion
-from validation_pipeline import ValidationPipeline
-
 
 def setup_logging():
     """Configure basic logging."""
+    if logging.getLogger().handlers:
+        return logging.getLogger(__name__)
+        
+    os.makedirs('logs', exist_ok=True)
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -141,6 +142,9 @@ Examples:
             print("STEP 1: DATA INGESTION")
             print("=" * 70)
             
+            # Imported here so --help and --setup don't pay for it
+            from data_ingestion import DataIngestion
+            
             ingestion = DataIngestion()
             filepath = ingestion.download_data()
             
@@ -157,6 +161,8 @@ Examples:
         print("STEP 2: DATA VALIDATION")
         print("=" * 70)
         
+        from validation_pipeline import ValidationPipeline
+        
         pipeline = ValidationPipeline()
         success = pipeline.run_pipeline(
             send_alerts=not args.no_alerts,
@@ -9,20 +9,47 @@ Date: November 2025
 """
 
 import os
+import atexit
 import logging
 import smtplib
 import json
+import hashlib
+import ssl
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, wait
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 from dotenv import load_dotenv
-import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Load environment variables
 load_dotenv()
 
 
+def _dumps(obj):
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode('utf-8')
+
+
+# Shared pool the alert channels are sent on, one worker per channel
+_ALERT_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='alert')
+
+
+@functools.lru_cache(maxsize=1)
+def _ssl_context():
+    """Build the TLS context once so the CA bundle is only loaded once."""
+    return ssl.create_default_context()
+
+
 class AlertSystem:
     """Class to handle alerts for data quality failures."""
     
@@ -37,35 +64,193 @@ class AlertSystem:
         self.logger = logging.getLogger(__name__)
         self.alert_config = config.get('alerts', {})
         
-    def send_alert(self, validation_results, failed_expectations):
+        # Connections are opened lazily and reused across alerts
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+        self._http = None
+        self._inflight = set()
+        
+        # Alerts raised within the debounce window are coalesced into one send
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._flush_timer = None
+        
+        # Buffered alerts are still sent when the process exits without close()
+        atexit.register(self.close)
+        
+        # Static message scaffolding, built once and filled in per alert
+        self._subject_tmpl = "COVID-19 Data Validation {status} - {timestamp}"
+        self._body_header = (
+            "\nCOVID-19 Data Quality Monitoring Alert\n"
+            + "=" * 60 + "\n\n"
+            "Timestamp: {timestamp}\n"
+            "Validation Status: {status}\n"
+        )
+        self._failures_header = "Failed Expectations ({count}):\n" + "-" * 60
+        self._stats_tmpl = (
+            "Validation Statistics:\n"
+            + "-" * 60 + "\n"
+            "Total Expectations: {evaluated}\n"
+            "Successful: {successful}\n"
+            "Failed: {failed}\n"
+            "Success Percentage: {percent}%\n"
+        )
+        self._action_footer = (
+            "\n"
+            "Action Required:\n"
+            "- Review the failed expectations above\n"
+            "- Check the quarantined data in data/quarantine/\n"
+            "- Review Great Expectations Data Docs for detailed results\n"
+            "- Fix data quality issues before re-running the pipeline\n\n"
+        )
+        
+    def close(self):
+        """Flush buffered alerts, then close the SMTP connection and HTTP session."""
+        # Drop the exit hook so atexit no longer keeps this instance alive
+        atexit.unregister(self.close)
+        
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+        self._flush(sync=True)
+        
+        # Let background sends finish before closing their connections
+        wait(self._inflight.copy())
+        
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except smtplib.SMTPException:
+                    pass
+                self._smtp = None
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        
+    def send_alert(self, validation_results, failed_expectations, sync=False):
         """
         Send alerts based on validation results.
         
         Args:
             validation_results (dict): Great Expectations validation results
             failed_expectations (list): List of failed expectation descriptions
+            sync (bool): Send immediately and wait for every channel to finish
             
         Returns:
-            bool: True if at least one alert was sent successfully
+            bool: True if at least one alert was sent (or queued) successfully
         """
         if not self.alert_config.get('enabled', False):
             self.logger.info("Alerts are disabled in configuration")
             return False
             
-        alert_sent = False
+        if not self._enabled_channels():
+            return False
+            
         message = self._create_alert_message(validation_results, failed_expectations)
         
-        # Send email alert
-        if self.alert_config.get('email', {}).get('enabled', False):
-            if self._send_email_alert(message):
-                alert_sent = True
+        debounce_s = self.alert_config.get('debounce_s', 0)
+        if sync or debounce_s <= 0:
+            return self._dispatch(message, sync=sync)
+            
+        # Key on the failure content rather than the rendered message, which
+        # embeds a timestamp and would never repeat across retries
+        key = hashlib.sha1(
+            repr((validation_results.get('success', False), failed_expectations)).encode()
+        ).hexdigest()
+        
+        with self._pending_lock:
+            if key in self._pending:
+                self._pending[key]['count'] += 1
+                return True
                 
-        # Send Slack alert
-        if self.alert_config.get('slack', {}).get('enabled', False):
-            if self._send_slack_alert(message):
-                alert_sent = True
+            self._pending[key] = {'message': message, 'count': 1}
+            if self._flush_timer is None:
+                # The timer waits for the channels on the shared pool, and is
+                # a daemon so it never holds up exit; close() flushes whatever
+                # is still buffered
+                self._flush_timer = threading.Timer(debounce_s, self._flush, kwargs={'sync': True})
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
                 
-        return alert_sent
+        return True
+        
+    def _flush(self, sync=False):
+        """
+        Send all buffered alerts as a single combined message.
+        
+        Args:
+            sync (bool): Wait for every channel to finish sending
+        
+        Returns:
+            bool: True if at least one alert was sent successfully
+        """
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._flush_timer = None
+            
+        if not pending:
+            return False
+            
+        if len(pending) == 1:
+            subject = pending[0]['message']['subject']
+        else:
+            subject = f"COVID-19 Data Validation - {len(pending)} alerts"
+            
+        parts = []
+        for entry in pending:
+            if len(pending) > 1:
+                parts.append(entry['message']['subject'])
+            if entry['count'] > 1:
+                parts.append(f"(Repeated {entry['count']} times)")
+            parts.append(entry['message']['body'])
+            
+        return self._dispatch({'subject': subject, 'body': "\n".join(parts)}, sync=sync)
+        
+    def _enabled_channels(self):
+        """Return the send functions for every channel enabled in config."""
+        channels = []
+        if self.alert_config.get('email', {}).get('enabled', False):
+            channels.append(self._send_email_alert)
+        if self.alert_config.get('slack', {}).get('enabled', False):
+            channels.append(self._send_slack_alert)
+        return channels
+        
+    def _dispatch(self, message, sync=False):
+        """
+        Send a message to every enabled alert channel.
+        
+        Channels are independent network calls, so they are sent in parallel
+        on the shared alert pool. Once the interpreter is shutting down the
+        pool no longer accepts work, and the channels are sent one after
+        another on the calling thread instead.
+        
+        Args:
+            message (dict): Message dictionary with subject and body
+            sync (bool): Wait for every channel to finish sending
+            
+        Returns:
+            bool: True if at least one channel sent successfully (or, when
+                not waiting, was submitted)
+        """
+        channels = self._enabled_channels()
+        if not channels:
+            return False
+            
+        try:
+            futures = [_ALERT_POOL.submit(send, message) for send in channels]
+        except RuntimeError:
+            return any([send(message) for send in channels])
+            
+        for future in futures:
+            self._inflight.add(future)
+            future.add_done_callback(self._inflight.discard)
+            
+        if not sync:
+            return True
+            
+        return any([future.result() for future in futures])
         
     def _create_alert_message(self, validation_results, failed_expectations):
         """
@@ -81,42 +266,34 @@ class AlertSystem:
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         success = validation_results.get('success', False)
         
-        subject = f"COVID-19 Data Validation {'PASSED' if success else 'FAILED'} - {timestamp}"
+        subject = self._subject_tmpl.format(
+            status='PASSED' if success else 'FAILED',
+            timestamp=timestamp
+        )
         
-        body = f"""
-COVID-19 Data Quality Monitoring Alert
-{'=' * 60}
-
-Timestamp: {timestamp}
-Validation Status: {'SUCCESS' if success else 'FAILURE'}
-
-"""
+        parts = [self._body_header.format(
+            timestamp=timestamp,
+            status='SUCCESS' if success else 'FAILURE'
+        )]
         
         if not success and failed_expectations:
-            body += f"Failed Expectations ({len(failed_expectations)}):\n"
-            body += "-" * 60 + "\n"
-            for i, expectation in enumerate(failed_expectations, 1):
-                body += f"{i}. {expectation}\n"
-            body += "\n"
+            parts.append(self._failures_header.format(count=len(failed_expectations)))
+            parts.extend(f"{i}. {expectation}" for i, expectation in enumerate(failed_expectations, 1))
+            parts.append("")
             
         # Add statistics if available
         statistics = validation_results.get('statistics', {})
         if statistics:
-            body += "Validation Statistics:\n"
-            body += "-" * 60 + "\n"
-            body += f"Total Expectations: {statistics.get('evaluated_expectations', 'N/A')}\n"
-            body += f"Successful: {statistics.get('successful_expectations', 'N/A')}\n"
-            body += f"Failed: {statistics.get('unsuccessful_expectations', 'N/A')}\n"
-            body += f"Success Percentage: {statistics.get('success_percent', 'N/A')}%\n\n"
+            parts.append(self._stats_tmpl.format(
+                evaluated=statistics.get('evaluated_expectations', 'N/A'),
+                successful=statistics.get('successful_expectations', 'N/A'),
+                failed=statistics.get('unsuccessful_expectations', 'N/A'),
+                percent=statistics.get('success_percent', 'N/A')
+            ))
             
-        body += """
-Action Required:
-- Review the failed expectations above
-- Check the quarantined data in data/quarantine/
-- Review Great Expectations Data Docs for detailed results
-- Fix data quality issues before re-running the pipeline
-
-"""
+        parts.append(self._action_footer)
+        
+        body = "\n".join(parts)
         
         return {
             'subject': subject,
@@ -155,11 +332,13 @@ Action Required:
             msg['Subject'] = message['subject']
             msg.attach(MIMEText(message['body'], 'plain'))
             
-            # Send email
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(sender, password)
-                server.send_message(msg)
+            # Send email, reconnecting once if the cached connection dropped
+            with self._smtp_lock:
+                try:
+                    self._get_smtp(smtp_server, smtp_port, sender, password).send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    self._smtp = None
+                    self._get_smtp(smtp_server, smtp_port, sender, password).send_message(msg)
                 
             self.logger.info(f"Email alert sent to {', '.join(recipients)}")
             return True
@@ -168,6 +347,29 @@ Action Required:
             self.logger.error(f"Failed to send email alert: {e}")
             return False
             
+    def _get_smtp(self, smtp_server, smtp_port, sender, password):
+        """
+        Return the cached SMTP connection, opening and logging in if needed.
+        
+        Must be called with self._smtp_lock held.
+        """
+        if self._smtp is None:
+            # Implicit TLS (port 465) skips the STARTTLS upgrade round trips
+            use_ssl = self.alert_config.get('email', {}).get('use_ssl', int(smtp_port) == 465)
+            if use_ssl:
+                server = smtplib.SMTP_SSL(smtp_server, smtp_port, context=_ssl_context())
+            else:
+                server = smtplib.SMTP(smtp_server, smtp_port)
+            try:
+                if not use_ssl:
+                    server.starttls(context=_ssl_context())
+                server.login(sender, password)
+            except Exception:
+                server.close()
+                raise
+            self._smtp = server
+        return self._smtp
+        
     def _send_slack_alert(self, message):
         """
         Send Slack alert.
@@ -210,14 +412,17 @@ Action Required:
             }
             
             # Send to Slack
-            response = requests.post(
+            if self._http is None:
+                import requests
+                self._http = requests.Session()
+                
+            response = self._http.post(
                 webhook_url,
-                json=slack_message,
+                data=_dumps(slack_message),
                 headers={'Content-Type': 'application/json'},
                 timeout=10
             )
             response.raise_for_status()
-            
             self.logger.info("Slack alert sent successfully")
             return True
             
@@ -256,7 +461,10 @@ def test_alerts(config):
     ]
     
     # Send test alert
-    success = alert_system.send_alert(test_results, test_failures)
+    try:
+        success = alert_system.send_alert(test_results, test_failures, sync=True)
+    finally:
+        alert_system.close()
     
     if success:
         print("\nTest alert sent successfully!")
@@ -10,16 +10,79 @@ Date: November 2025
 
 import os
 import sys
+import gzip
+import zlib
 import logging
 import requests
 from datetime import datetime
+from email.utils import formatdate
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 import yaml
 
+from logging_config import configure_logging
+from utils import load_config
+
+
+# Shared HTTP session so repeated downloads reuse the TLS connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+# Stream downloads in 1 MiB chunks to keep per-chunk Python overhead low
+_CHUNK_SIZE = 1 << 20
+
+
+def raw_data_file(config):
+    """
+    Path of the latest raw download for a configuration.
+    
+    Args:
+        config (dict): Configuration dictionary
+        
+    Returns:
+        str: <raw_data>/latest.csv, or latest.csv.gz when
+            data_source.compressed is enabled
+    """
+    compressed = config['data_source'].get('compressed', False)
+    filename = 'latest.csv.gz' if compressed else 'latest.csv'
+    return os.path.join(config['paths']['raw_data'], filename)
+
+
+def _read_head(filepath, size=4096):
+    """
+    Read the first bytes of a file without text decoding.
+    
+    Gzipped files (.gz) are decompressed; otherwise uses a single pread(2)
+    where available (not on Windows).
+    
+    Args:
+        filepath (str): Path to file
+        size (int): Maximum number of bytes to read
+        
+    Returns:
+        bytes: Up to size bytes from the start of the file
+    """
+    if filepath.endswith('.gz'):
+        with gzip.open(filepath, 'rb') as file:
+            return file.read(size)
+            
+    if hasattr(os, 'pread'):
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            return os.pread(fd, size, 0)
+        finally:
+            os.close(fd)
+            
+    with open(filepath, 'rb') as file:
+        return file.read(size)
+
 
 class DataIngestion:
     """Class to handle COVID-19 data ingestion from external sources."""
     
+    # Columns that must appear in the header of a valid download
+    EXPECTED_COLUMNS = frozenset({'iso_code', 'date', 'location'})
+    
     def __init__(self, config_path='config/config.yaml'):
         """
         Initialize the DataIngestion class.
@@ -28,8 +91,9 @@ class DataIngestion:
             config_path (str): Path to configuration file
         """
         self.config = self._load_config(config_path)
-        self._setup_logging()
         self.logger = logging.getLogger(__name__)
+        # (filepath, size in bytes) of the last download whose header passed
+        self._last_download = None
         
     def _load_config(self, config_path):
         """
@@ -42,8 +106,7 @@ class DataIngestion:
             dict: Configuration dictionary
         """
         try:
-            with open(config_path, 'r') as file:
-                return yaml.safe_load(file)
+            return load_config(config_path)
         except FileNotFoundError:
             print(f"Configuration file not found at {config_path}")
             sys.exit(1)
@@ -51,26 +114,6 @@ class DataIngestion:
             print(f"Error parsing YAML configuration: {e}")
             sys.exit(1)
             
-    def _setup_logging(self):
-        """Configure logging based on configuration file."""
-        log_config = self.config.get('logging', {})
-        log_level = getattr(logging, log_config.get('level', 'INFO'))
-        log_format = log_config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        log_file = log_config.get('file', 'logs/pipeline.log')
-        
-        # Create logs directory if it doesn't exist
-        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
-        
-        # Configure logging
-        logging.basicConfig(
-            level=log_level,
-            format=log_format,
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
-        
     def download_data(self):
         """
         Download the latest COVID-19 data from the configured URL.
@@ -80,28 +123,107 @@ class DataIngestion:
         """
         url = self.config['data_source']['url']
         timeout = self.config['data_source'].get('download_timeout', 300)
+        compressed = self.config['data_source'].get('compressed', False)
         raw_data_path = self.config['paths']['raw_data']
         
         # Create raw data directory if it doesn't exist
         Path(raw_data_path).mkdir(parents=True, exist_ok=True)
         
-        # Always save as latest.csv for simplicity
-        filename = "latest.csv"
-        filepath = os.path.join(raw_data_path, filename)
+        # Always save as latest.csv (or latest.csv.gz) for simplicity
+        filepath = raw_data_file(self.config)
+        etag_path = filepath + '.etag'
+        last_modified_path = filepath + '.last_modified'
+        
+        # Ask the server to skip the transfer if our copy is still current.
+        # Prefer the server's own Last-Modified; the file mtime is refreshed
+        # on every 304 so it no longer says when the data last changed.
+        headers = {'Accept-Encoding': 'gzip'} if compressed else {}
+        if os.path.exists(filepath):
+            if os.path.exists(last_modified_path):
+                with open(last_modified_path, 'r') as file:
+                    headers['If-Modified-Since'] = file.read().strip()
+            else:
+                headers['If-Modified-Since'] = formatdate(os.path.getmtime(filepath), usegmt=True)
+            if os.path.exists(etag_path):
+                with open(etag_path, 'r') as file:
+                    headers['If-None-Match'] = file.read().strip()
         
         self.logger.info(f"Starting download from {url}")
         
         try:
-            response = requests.get(url, timeout=timeout, stream=True)
+            response = _SESSION.get(url, timeout=timeout, stream=True, headers=headers)
+            
+            if response.status_code == 304:
+                response.close()
+                # Touch the file so the retention cleanup sees it as fresh
+                os.utime(filepath)
+                self.logger.info(f"Remote data not modified, keeping {filepath}")
+                return filepath
+                
             response.raise_for_status()
             
-            # Write data to file
-            with open(filepath, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
+            # When keeping the file compressed, store the server's gzip bytes
+            # as-is; the header check then needs to inflate the first chunk.
+            # If the server did not compress, gzip the stream ourselves.
+            raw_gzip = compressed and response.headers.get('Content-Encoding', '').lower() == 'gzip'
+            if raw_gzip:
+                chunks = response.raw.stream(_CHUNK_SIZE, decode_content=False)
+                inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            else:
+                chunks = response.iter_content(chunk_size=_CHUNK_SIZE)
+                inflater = None
+                
+            # Write data to a temporary file, checking the header as soon as
+            # the first line has arrived instead of re-opening the file
+            # afterwards. The finished file is renamed over the target so
+            # readers never see a partial download.
+            tmp_path = f"{filepath}.tmp.{os.getpid()}"
+            total = 0
+            header_buf = b''
+            header_ok = None
+            try:
+                with open(tmp_path, 'wb', buffering=_CHUNK_SIZE) as file:
+                    out = file
+                    if compressed and not raw_gzip:
+                        out = gzip.GzipFile(fileobj=file, mode='wb', compresslevel=1)
+                        
+                    for chunk in chunks:
+                        total += len(chunk)
+                        if header_ok is None:
+                            header_buf += inflater.decompress(chunk) if inflater else chunk
+                            if b'\n' in header_buf:
+                                header_ok = self._check_header(header_buf.split(b'\n', 1)[0])
+                                if not header_ok:
+                                    return None
+                        out.write(chunk)
+                        
+                    if header_ok is None:
+                        # Single-line file: the header is everything we received
+                        header_ok = self._check_header(header_buf)
+                        if not header_ok:
+                            return None
+                            
+                    if out is not file:
+                        out.close()
+                    file.flush()
+                    os.fsync(file.fileno())
+                    
+                os.replace(tmp_path, filepath)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
                     
-            file_size = os.path.getsize(filepath)
-            self.logger.info(f"Successfully downloaded {file_size:,} bytes to {filepath}")
+            # Keep the validator sidecars in step with the file now on disk
+            for sidecar, header in ((etag_path, 'ETag'), (last_modified_path, 'Last-Modified')):
+                value = response.headers.get(header)
+                if value:
+                    with open(sidecar, 'w') as file:
+                        file.write(value)
+                elif os.path.exists(sidecar):
+                    os.remove(sidecar)
+                
+            self._last_download = (filepath, total)
+            self.logger.info(f"Successfully downloaded {total:,} bytes to {filepath}")
             
             return filepath
             
@@ -112,6 +234,29 @@ class DataIngestion:
             self.logger.error(f"Failed to write data to file: {e}")
             return None
             
+    def _check_header(self, header):
+        """
+        Check that a raw CSV header line contains the expected columns.
+        
+        Args:
+            header (bytes): First line of the CSV file
+            
+        Returns:
+            bool: True if all expected columns are present
+        """
+        if not header:
+            self.logger.error("File has no header")
+            return False
+            
+        # Compare whole column names so e.g. 'iso_code_x' does not count
+        columns = {col.strip().lower() for col in header.decode('utf-8', 'ignore').split(',')}
+        missing = self.EXPECTED_COLUMNS - columns
+        if missing:
+            self.logger.error(f"Expected columns not found in header: {', '.join(sorted(missing))}")
+            return False
+            
+        return True
+        
     def validate_download(self, filepath):
         """
         Perform basic validation on the downloaded file.
@@ -122,11 +267,22 @@ class DataIngestion:
         Returns:
             bool: True if file is valid, False otherwise
         """
-        if not filepath or not os.path.exists(filepath):
+        # Reuse the size and header check recorded while streaming the
+        # download; other files need a single stat for existence and size
+        try:
+            if not filepath:
+                raise FileNotFoundError(filepath)
+            if self._last_download and self._last_download[0] == filepath:
+                if not os.path.exists(filepath):
+                    raise FileNotFoundError(filepath)
+                file_size = self._last_download[1]
+                header_ok = True
+            else:
+                file_size = os.stat(filepath).st_size
+                header_ok = None
+        except FileNotFoundError:
             self.logger.error("File does not exist")
             return False
-            
-        file_size = os.path.getsize(filepath)
         
         # Check if file is not empty
         if file_size == 0:
@@ -138,23 +294,14 @@ class DataIngestion:
             self.logger.warning(f"File size ({file_size} bytes) seems unusually small")
             return False
             
-        # Try to read first few lines to verify it's a valid CSV
-        try:
-            with open(filepath, 'r', encoding='utf-8') as file:
-                header = file.readline()
-                if not header:
-                    self.logger.error("File has no header")
-                    return False
-                    
-                # Check for expected columns
-                expected_columns = ['iso_code', 'date', 'location']
-                for col in expected_columns:
-                    if col not in header.lower():
-                        self.logger.error(f"Expected column '{col}' not found in header")
-                        return False
-                        
-        except Exception as e:
-            self.logger.error(f"Error reading file: {e}")
+        if header_ok is None:
+            try:
+                header_ok = self._check_header(_read_head(filepath).split(b'\n', 1)[0].rstrip(b'\r'))
+            except Exception as e:
+                self.logger.error(f"Error reading file: {e}")
+                return False
+                
+        if not header_ok:
             return False
             
         self.logger.info("File validation passed")
@@ -169,6 +316,7 @@ def main():
     
     # Initialize data ingestion
     ingestion = DataIngestion()
+    configure_logging(ingestion.config)
     
     # Download data
     filepath = ingestion.download_data()
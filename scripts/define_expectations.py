@@ -10,17 +10,32 @@ Date: November 2025
 
 import os
 import sys
+import random
 import logging
-import yaml
 import pandas as pd
 
 try:
     import great_expectations as gx
+    import great_expectations.expectations as gxe
     from great_expectations.core import ExpectationSuite
 except ImportError:
     print("Great Expectations not installed. Please run: pip install great-expectations")
     sys.exit(1)
 
+from data_ingestion import raw_data_file
+from utils import load_config, csv_meta, REQUIRED_COLUMNS, COUNT_COLUMNS, COLUMN_DTYPES
+
+
+# Key columns that should never be null
+NON_NULL_COLUMNS = ['iso_code', 'location', 'date']
+
+# Known continents, in a fixed order so the serialized suite is stable
+# across runs (set iteration order depends on PYTHONHASHSEED)
+CONTINENTS = (
+    'Africa', 'Asia', 'Europe', 'North America',
+    'South America', 'Oceania', 'Antarctica', None
+)
+
 
 class ExpectationBuilder:
     """Class to build and manage data quality expectations."""
@@ -38,8 +53,7 @@ class ExpectationBuilder:
         
     def _load_config(self, config_path):
         """Load configuration from YAML file."""
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
+        return load_config(config_path)
             
     def _setup_logging(self):
         """Configure logging."""
@@ -49,27 +63,41 @@ class ExpectationBuilder:
         )
         return logging.getLogger(__name__)
         
-    def load_sample_data(self, filepath=None):
+    def load_sample_data(self, filepath=None, sample_size=10000, seed=42):
         """
         Load sample data for expectation building.
         
+        Rows are drawn uniformly from the whole file rather than taken from
+        its head, which for OWID only covers the first few countries
+        alphabetically.
+        
         Args:
             filepath (str): Path to CSV file. If None, uses latest raw data.
+            sample_size (int): Number of data rows to sample
+            seed (int): Random seed so repeated builds see the same sample
             
         Returns:
             pandas.DataFrame: Sample data
         """
         if filepath is None:
-            raw_data_path = self.config['paths']['raw_data']
-            filepath = os.path.join(raw_data_path, 'latest.csv')
+            filepath = raw_data_file(self.config)
             
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Data file not found at {filepath}")
             
         self.logger.info(f"Loading sample data from {filepath}")
-        # Load first 10000 rows for faster processing
-        df = pd.read_csv(filepath, nrows=10000)
-        self.logger.info(f"Loaded {len(df)} rows with {len(df.columns)} columns")
+        n_rows = csv_meta(filepath)['row_count']
+        keep = set(random.Random(seed).sample(range(1, n_rows + 1), min(sample_size, n_rows)))
+        
+        # Load sampled rows of the columns we build expectations for.
+        # 'date' stays a string so the strftime-format expectation applies.
+        df = pd.read_csv(
+            filepath,
+            usecols=lambda col: col in REQUIRED_COLUMNS,
+            dtype=COLUMN_DTYPES,
+            skiprows=lambda i: i > 0 and i not in keep
+        )
+        self.logger.info(f"Sampled {len(df)} of {n_rows} rows with {len(df.columns)} columns")
         
         return df
         
@@ -113,124 +141,153 @@ class ExpectationBuilder:
         
         return validator
         
-    def define_expectations(self, validator):
+    def _build_expectations(self):
         """
-        Define all data quality expectations for COVID-19 data.
+        Build all data quality expectations for COVID-19 data.
+        
+        Expectations are declared as objects and grouped by column set so
+        they can be registered on the suite in one batch instead of one
+        validator round trip (and sample scan) per expectation.
         
-        Args:
-            validator: Great Expectations validator
-            
         Returns:
-            ExpectationSuite: Updated expectation suite
+            list: Great Expectations expectation objects
         """
-        self.logger.info("Defining data quality expectations...")
+        expectations = []
         
         # 1. Column Existence Expectations
         self.logger.info("Adding column existence expectations...")
         
-        required_columns = [
-            'iso_code', 'continent', 'location', 'date',
-            'total_cases', 'new_cases', 'total_deaths', 'new_deaths',
-            'population'
-        ]
-        
-        for column in required_columns:
-            validator.expect_column_to_exist(column=column)
+        expectations.extend(
+            gxe.ExpectColumnToExist(column=column) for column in REQUIRED_COLUMNS
+        )
             
         # 2. Null Value Expectations
         self.logger.info("Adding null value expectations...")
         
         # Key columns should never be null
-        non_null_columns = ['iso_code', 'location', 'date']
-        for column in non_null_columns:
-            validator.expect_column_values_to_not_be_null(column=column)
+        expectations.extend(
+            gxe.ExpectColumnValuesToNotBeNull(column=column) for column in NON_NULL_COLUMNS
+        )
             
         # Some columns can have nulls but should be mostly populated
-        validator.expect_column_values_to_not_be_null(
-            column='population',
-            mostly=0.95
+        expectations.append(
+            gxe.ExpectColumnValuesToNotBeNull(column='population', mostly=0.95)
         )
             
         # 3. Value Range Expectations
         self.logger.info("Adding value range expectations...")
         
         # Non-negative values for counts
-        count_columns = [
-            'total_cases', 'new_cases', 'total_deaths', 'new_deaths'
-        ]
-        
-        for column in count_columns:
-            validator.expect_column_values_to_be_between(
+        expectations.extend(
+            gxe.ExpectColumnValuesToBeBetween(
                 column=column,
                 min_value=0,
                 mostly=0.99  # Allow 1% outliers for data quality issues
             )
+            for column in COUNT_COLUMNS
+        )
             
         # Population should be positive
-        validator.expect_column_values_to_be_between(
-            column='population',
-            min_value=1,
-            mostly=0.99
+        expectations.append(
+            gxe.ExpectColumnValuesToBeBetween(
+                column='population',
+                min_value=1,
+                mostly=0.99
+            )
         )
         
         # 4. Data Type Expectations
         self.logger.info("Adding data type expectations...")
         
         # Date should be parseable as date
-        validator.expect_column_values_to_match_strftime_format(
-            column='date',
-            strftime_format='%Y-%m-%d'
+        expectations.append(
+            gxe.ExpectColumnValuesToMatchStrftimeFormat(
+                column='date',
+                strftime_format='%Y-%m-%d'
+            )
         )
         
         # ISO codes should be 3 characters
-        validator.expect_column_value_lengths_to_equal(
-            column='iso_code',
-            value=3,
-            mostly=0.95  # Some entries might be aggregates with different codes
+        expectations.append(
+            gxe.ExpectColumnValueLengthsToEqual(
+                column='iso_code',
+                value=3,
+                mostly=0.95  # Some entries might be aggregates with different codes
+            )
         )
         
         # 5. Set Membership Expectations
         self.logger.info("Adding set membership expectations...")
         
         # Continent should be from known set
-        valid_continents = [
-            'Africa', 'Asia', 'Europe', 'North America', 
-            'South America', 'Oceania', 'Antarctica', None
-        ]
-        
-        validator.expect_column_values_to_be_in_set(
-            column='continent',
-            value_set=valid_continents,
-            mostly=0.95
+        expectations.append(
+            gxe.ExpectColumnValuesToBeInSet(
+                column='continent',
+                value_set=list(CONTINENTS),
+                mostly=0.95
+            )
         )
         
         # 6. Statistical Expectations
         self.logger.info("Adding statistical expectations...")
         
         # New cases should have reasonable distribution (not all zeros)
-        validator.expect_column_mean_to_be_between(
-            column='new_cases',
-            min_value=0,
-            max_value=1000000  # Reasonable upper bound
+        expectations.append(
+            gxe.ExpectColumnMeanToBeBetween(
+                column='new_cases',
+                min_value=0,
+                max_value=1000000  # Reasonable upper bound
+            )
         )
         
+        return expectations
+        
+    def define_expectations(self, validator=None):
+        """
+        Define all data quality expectations for COVID-19 data.
+        
+        The suite is declared directly; nothing is evaluated unless a
+        validator is given, since validation proper happens later in
+        validation_pipeline.py.
+        
+        Args:
+            validator: Optional Great Expectations validator to check the
+                new suite against its sample batch
+            
+        Returns:
+            ExpectationSuite: Updated expectation suite
+        """
+        self.logger.info("Defining data quality expectations...")
+        
+        suite = ExpectationSuite(
+            name=self.config['validation']['expectation_suite_name'],
+            expectations=self._build_expectations()
+        )
+        
+        if validator is not None:
+            # Check the whole suite against the sample in a single pass
+            result = validator.validate(expectation_suite=suite)
+            self.logger.info(f"Sample validation success: {result.success}")
+        
         self.logger.info("All expectations defined successfully!")
         
         # Save expectation suite - update existing instead of adding
         try:
-            self.context.suites.delete(validator.expectation_suite.name)
+            self.context.suites.delete(suite.name)
         except Exception:
             pass
-        self.context.suites.add(validator.expectation_suite)
+        self.context.suites.add(suite)
         
-        return validator.expectation_suite
+        return suite
         
-    def build_expectations(self, filepath=None):
+    def build_expectations(self, filepath=None, validate_sample=False):
         """
         Complete workflow to build expectations.
         
         Args:
             filepath (str): Optional path to sample data file
+            validate_sample (bool): Also load a data sample and check the
+                new suite against it
             
         Returns:
             bool: True if successful
@@ -240,18 +297,20 @@ class ExpectationBuilder:
             print("Building Data Quality Expectations")
             print("=" * 60)
             
-            # Load sample data
-            print("\n[1/3] Loading sample data...")
-            df = self.load_sample_data(filepath)
-            print(f"Data shape: {df.shape}")
-            print(f"Columns: {', '.join(df.columns[:10])}...")
-            
-            # Create validator
-            print("\n[2/3] Creating validator...")
-            validator = self.create_batch_and_validator(df)
-            
+            validator = None
+            if validate_sample:
+                # Load sample data
+                print("\n[1/3] Loading sample data...")
+                df = self.load_sample_data(filepath)
+                print(f"Data shape: {df.shape}")
+                print(f"Columns: {', '.join(df.columns[:10])}...")
+                
+                # Create validator
+                print("\n[2/3] Creating validator...")
+                validator = self.create_batch_and_validator(df)
+                
             # Define expectations
-            print("\n[3/3] Defining expectations...")
+            print("\n[3/3] Defining expectations..." if validate_sample else "\nDefining expectations...")
             suite = self.define_expectations(validator)
             
             print("\n" + "=" * 60)
@@ -284,11 +343,11 @@ class ExpectationBuilder:
 
 def main():
     """Main execution function."""
-    # Check if sample data file provided as argument
+    # A sample data file given as argument is also used to check the suite
     filepath = sys.argv[1] if len(sys.argv) > 1 else None
     
     builder = ExpectationBuilder()
-    success = builder.build_expectations(filepath)
+    success = builder.build_expectations(filepath, validate_sample=filepath is not None)
     
     return 0 if success else 1
 
@@ -0,0 +1,71 @@
+"""
+Logging configuration for COVID-19 Data Quality Monitoring System
+
+This module sets up the root logger from the configuration file. It is meant
+to be called once at program entry; classes only fetch their own loggers.
+
+Author: Data Engineering Team
+Date: November 2025
+"""
+
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+from pathlib import Path
+
+
+def configure_logging(config):
+    """
+    Configure the root logger based on configuration file.
+    
+    Does nothing if the root logger already has handlers, so calling it
+    again (or after another entry point configured logging) is cheap.
+    
+    Log calls only put the record on a queue; a background listener
+    formats it and writes to the log file and stdout, so callers never
+    wait on disk writes. At interpreter exit the listener is drained and
+    the handlers are attached directly for any remaining records.
+    
+    Args:
+        config (dict): Configuration dictionary
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+        
+    log_config = config.get('logging', {})
+    log_level = getattr(logging, log_config.get('level', 'INFO'))
+    log_format = log_config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    log_file = log_config.get('file', 'logs/pipeline.log')
+    
+    # Create logs directory if it doesn't exist
+    Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+    
+    formatter = logging.Formatter(log_format)
+    handlers = [
+        logging.FileHandler(log_file),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        
+    # Configure logging
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    
+    def _stop_listener():
+        # Drain the queue, then write directly so records logged by later
+        # exit handlers are not lost
+        listener.stop()
+        root.removeHandler(queue_handler)
+        for handler in handlers:
+            root.addHandler(handler)
+            
+    atexit.register(_stop_listener)
+    
+    root.setLevel(log_level)
+    root.addHandler(queue_handler)
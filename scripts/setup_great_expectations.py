@@ -13,7 +13,6 @@ import sys
 import logging
 from pathlib import Path
 import pandas as pd
-import yaml
 
 try:
     import great_expectations as gx
@@ -22,6 +21,8 @@ except ImportError:
     print("Great Expectations not installed. Please run: pip install great-expectations")
     sys.exit(1)
 
+from utils import load_config
+
 
 class GreatExpectationsSetup:
     """Class to handle Great Expectations initialization and configuration."""
@@ -39,8 +40,7 @@ class GreatExpectationsSetup:
         
     def _load_config(self, config_path):
         """Load configuration from YAML file."""
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
+        return load_config(config_path)
             
     def _setup_logging(self):
         """Configure logging."""
@@ -14,9 +14,14 @@ import os
 import sys
 import logging
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime
 
+from utils import COUNT_COLUMNS, open_csv_columns, scan_counts, warm_scan_counts
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +32,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compile (or load from cache) the count kernel before any data is read
+warm_scan_counts()
+
 def validate_covid_data():
     """
     Simple validation of COVID-19 data.
@@ -46,24 +54,70 @@ def validate_covid_data():
         print(f"[1/3] Loading data from {data_path}...")
         if not data_path.exists():
             logger.error(f"Data file not found at {data_path}")
-            # Try to find any CSV file
-            csv_files = list(Path("data/raw").glob("*.csv"))
+            # Try to find any CSV file (plain or gzipped)
+            csv_files = list(Path("data/raw").glob("*.csv")) + list(Path("data/raw").glob("*.csv.gz"))
             if csv_files:
                 data_path = csv_files[0]
                 logger.info(f"Using alternative file: {data_path}")
             else:
                 raise FileNotFoundError("No CSV files found in data/raw/")
         
-        df = pd.read_csv(data_path)
-        logger.info(f"Loaded {len(df):,} rows with {len(df.columns)} columns")
-        print(f"   ✓ Loaded {len(df):,} rows\n")
+        # Stream every column (known dtypes for the OWID columns we check,
+        # inferred for the rest) so one block of the file is in memory at a
+        # time. Each batch is appended to the Parquet output; the checks only
+        # touch what they need: null counts come from Arrow metadata, only
+        # the numeric count columns are converted for the negative-value
+        # scan, and the date range is reduced in Arrow.
+        output_file = validated_path / f"covid_data_validated_{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+        tmp_file = output_file.with_name(output_file.name + '.tmp')
+        reader = open_csv_columns(str(data_path), None)
+        columns = reader.schema.names
+        count_columns = [col for col in COUNT_COLUMNS if col in columns]
+        
+        dtypes = reader.schema.empty_table().to_pandas(date_as_object=False).dtypes.value_counts().to_dict()
+        dates_parsed = 'date' in columns and pa.types.is_temporal(reader.schema.field('date').type)
+        
+        row_count = 0
+        null_counts = [0] * len(columns)
+        negative_counts = dict.fromkeys(count_columns, 0)
+        date_min = date_max = None
+        
+        try:
+            # Parquet is columnar and compressed: far less to write (and to
+            # read back later) than the equivalent CSV
+            with pq.ParquetWriter(tmp_file, reader.schema, compression='snappy') as writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    row_count += batch.num_rows
+                    
+                    # Arrow tracks null counts per array, so no scan is needed
+                    for i, column in enumerate(batch.columns):
+                        null_counts[i] += column.null_count
+                        
+                    counts = pa.Table.from_batches([batch]).select(count_columns).to_pandas()
+                    for col, stats in scan_counts(counts, count_columns).items():
+                        negative_counts[col] += stats['negative']
+                        
+                    if dates_parsed:
+                        bounds = pc.min_max(batch.column('date'))
+                        batch_min, batch_max = bounds['min'].as_py(), bounds['max'].as_py()
+                        if batch_min is not None:
+                            date_min = batch_min if date_min is None else min(date_min, batch_min)
+                            date_max = batch_max if date_max is None else max(date_max, batch_max)
+            os.replace(tmp_file, output_file)
+        finally:
+            if tmp_file.exists():
+                tmp_file.unlink()
+                
+        logger.info(f"Loaded {row_count:,} rows with {len(columns)} columns")
+        print(f"   ✓ Loaded {row_count:,} rows\n")
         
         # Basic validation
         print("[2/3] Running basic validation...")
         
         # Check required columns
         required_columns = ['iso_code', 'location', 'date', 'total_cases', 'total_deaths']
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing_columns = [col for col in required_columns if col not in columns]
         
         if missing_columns:
             logger.warning(f"Missing columns: {missing_columns}")
@@ -72,31 +126,34 @@ def validate_covid_data():
             print(f"   ✓ All required columns present")
         
         # Check data types
-        print(f"   ✓ Columns found: {len(df.columns)}")
-        print(f"   ✓ Data types: {df.dtypes.value_counts().to_dict()}")
+        print(f"   ✓ Columns found: {len(columns)}")
+        print(f"   ✓ Data types: {dtypes}")
         
         # Check null values
-        null_counts = df.isnull().sum()
-        high_null_cols = null_counts[null_counts > len(df) * 0.5].index.tolist()
+        high_null_cols = [col for col, nulls in zip(columns, null_counts) if nulls > row_count * 0.5]
         if high_null_cols:
             print(f"   ⚠ Columns with >50% nulls: {len(high_null_cols)}")
         else:
             print(f"   ✓ No columns with excessive nulls")
         
+        # Check case/death counts are non-negative
+        negative_cols = [col for col, negatives in negative_counts.items() if negatives]
+        if negative_cols:
+            print(f"   ⚠ Negative values in: {', '.join(negative_cols)}")
+        else:
+            print(f"   ✓ No negative counts")
+        
         # Check date range
-        if 'date' in df.columns:
-            try:
-                df['date'] = pd.to_datetime(df['date'])
-                print(f"   ✓ Date range: {df['date'].min()} to {df['date'].max()}")
-            except:
+        if 'date' in columns:
+            if dates_parsed and date_min is not None:
+                print(f"   ✓ Date range: {pd.Timestamp(date_min)} to {pd.Timestamp(date_max)}")
+            else:
                 print(f"   ⚠ Could not parse dates")
         
         print()
         
-        # Save validated data
+        # Validated data was written while streaming
         print("[3/3] Saving validated data...")
-        output_file = validated_path / f"covid_data_validated_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        df.to_csv(output_file, index=False)
         logger.info(f"Saved validated data to {output_file}")
         print(f"   ✓ Saved to {output_file}\n")
         
@@ -105,8 +162,8 @@ def validate_covid_data():
         print("VALIDATION SUMMARY")
         print("=" * 60)
         print(f"Status: SUCCESS")
-        print(f"Rows processed: {len(df):,}")
-        print(f"Columns: {len(df.columns)}")
+        print(f"Rows processed: {row_count:,}")
+        print(f"Columns: {len(columns)}")
         print(f"Output: {output_file}")
         print("=" * 60)
         
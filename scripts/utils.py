@@ -8,10 +8,144 @@ Date: November 2025
 """
 
 import os
+import csv
+import gzip
+import json
+import fnmatch
 import logging
+import functools
 from datetime import datetime, timedelta
 from pathlib import Path
-import pandas as pd
+import yaml
+
+# numpy, pandas, pyarrow and numba are imported inside the functions that use
+# them: load_config is imported at DAG parse time and by the triggerer, which
+# should not pay for the dataframe stack
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Columns of the OWID dataset used by the validation scripts
+REQUIRED_COLUMNS = [
+    'iso_code', 'continent', 'location', 'date',
+    'total_cases', 'new_cases', 'total_deaths', 'new_deaths',
+    'population'
+]
+
+# Cumulative and daily case/death counts; never negative
+COUNT_COLUMNS = ['total_cases', 'new_cases', 'total_deaths', 'new_deaths']
+
+# Explicit dtypes for REQUIRED_COLUMNS so read_csv skips type inference.
+# Counts stay float64 (they contain NaN, and float32 can't hold them exactly).
+COLUMN_DTYPES = {
+    'iso_code': 'category',
+    'continent': 'category',
+    'location': 'category',
+    'total_cases': 'float64',
+    'new_cases': 'float64',
+    'total_deaths': 'float64',
+    'new_deaths': 'float64',
+    'population': 'float64',
+}
+
+# Repository root; relative entries of the config's paths section are
+# resolved against it, whatever the working directory of the process
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# get_latest_file results keyed on (directory, pattern): (dir mtime_ns, path)
+_latest_file_cache = {}
+
+# Prefer the libyaml C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def _read_json(path):
+    """Load a JSON file, using orjson when it is installed."""
+    with open(path, 'rb') as file:
+        data = file.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json_atomic(obj, path):
+    """
+    Write obj as JSON to path via a temp file and rename.
+    
+    Values without a JSON form (e.g. YAML dates) raise TypeError rather
+    than being stringified, so a cache never changes what the source held.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    else:
+        data = json.dumps(obj).encode('utf-8')
+        
+    tmp = f"{path}.tmp.{os.getpid()}"
+    with open(tmp, 'wb') as file:
+        file.write(data)
+    os.replace(tmp, path)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path, mtime):
+    """Load a config file; cached per (path, mtime) so edits are picked up."""
+    cache = Path(path + '.cache.json')
+    
+    # A JSON copy of the parsed YAML is much cheaper to load; trust it only
+    # if it was written after the YAML was last modified
+    try:
+        if cache.stat().st_mtime >= os.stat(path).st_mtime:
+            return _resolve_paths(_read_json(cache))
+    except (OSError, ValueError):
+        pass
+        
+    with open(path, 'r') as file:
+        config = yaml.load(file, Loader=_YAML_LOADER)
+        
+    try:
+        _write_json_atomic(config, cache)
+    except (OSError, TypeError):
+        # Read-only location or non-JSON values: just skip the cache
+        pass
+        
+    return _resolve_paths(config)
+
+
+def _resolve_paths(config):
+    """
+    Make relative entries of config['paths'] absolute under PROJECT_ROOT.
+    
+    The Airflow worker, the triggerer and the DAG processor each have their
+    own working directory; resolving here means they all agree on where
+    data/raw etc. are.
+    """
+    paths = (config or {}).get('paths') or {}
+    for name, value in paths.items():
+        if isinstance(value, str) and not os.path.isabs(value):
+            paths[name] = str(PROJECT_ROOT / value)
+    return config
+
+
+def load_config(path):
+    """
+    Load a YAML configuration file.
+    
+    The parsed result is memoized in-process and mirrored to a
+    <path>.cache.json sidecar for later runs, both invalidated when the
+    YAML file changes. Relative entries of the paths section are returned
+    resolved against the project root.
+    
+    Args:
+        path (str): Path to configuration file
+        
+    Returns:
+        dict: Configuration dictionary
+    """
+    path = os.path.abspath(path)
+    return _load_config_cached(path, os.stat(path).st_mtime_ns)
 
 
 def setup_directories(config):
@@ -33,25 +167,46 @@ def get_latest_file(directory, pattern='*.csv'):
     
     Args:
         directory (str): Directory to search
-        pattern (str): File pattern (default: *.csv)
+        pattern (str or tuple): File pattern, or several alternative
+            patterns (default: *.csv)
         
     Returns:
         str: Path to most recent file, or None if no files found
     """
-    path = Path(directory)
+    patterns = (pattern,) if isinstance(pattern, str) else tuple(pattern)
     
-    if not path.exists():
+    # The directory's mtime changes whenever an entry is created, renamed or
+    # removed, so an unchanged mtime means the previous answer still holds.
+    # (Rewriting an existing file in place does not bump it; downloads are
+    # written to a temp file and renamed into place.)
+    try:
+        dir_mtime = os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
         return None
         
-    files = list(path.glob(pattern))
+    key = (directory, patterns)
+    cached = _latest_file_cache.get(key)
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1]
+        
+    latest_path = None
+    latest_mtime = None
     
-    if not files:
+    # scandir entries cache their stat result on most platforms, so this is
+    # one pass over the directory with no extra per-file syscalls
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.is_file() or not any(fnmatch.fnmatch(entry.name, p) for p in patterns):
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest_path, latest_mtime = entry.path, mtime
+    except FileNotFoundError:
         return None
         
-    # Sort by modification time
-    latest = max(files, key=lambda f: f.stat().st_mtime)
-    
-    return str(latest)
+    _latest_file_cache[key] = (dir_mtime, latest_path)
+    return latest_path
 
 
 def cleanup_old_files(directory, days_to_keep=30, pattern='*.csv'):
@@ -66,23 +221,27 @@ def cleanup_old_files(directory, days_to_keep=30, pattern='*.csv'):
     Returns:
         int: Number of files deleted
     """
-    path = Path(directory)
+    cutoff = (datetime.now() - timedelta(days=days_to_keep)).timestamp()
+    deleted_count = 0
     
-    if not path.exists():
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.is_file() or not fnmatch.fnmatch(entry.name, pattern):
+                    continue
+                if entry.stat().st_mtime < cutoff:
+                    try:
+                        os.unlink(entry.path)
+                        deleted_count += 1
+                    except OSError as e:
+                        logging.error(f"Failed to delete {entry.path}: {e}")
+    except FileNotFoundError:
         return 0
         
-    cutoff_date = datetime.now() - timedelta(days=days_to_keep)
-    deleted_count = 0
-    
-    for file in path.glob(pattern):
-        if file.stat().st_mtime < cutoff_date.timestamp():
-            try:
-                file.unlink()
-                deleted_count += 1
-                logging.info(f"Deleted old file: {file}")
-            except Exception as e:
-                logging.error(f"Failed to delete {file}: {e}")
-                
+    # One summary line instead of one per file
+    if deleted_count:
+        logging.info(f"Deleted {deleted_count} old file(s) matching {pattern} from {directory}")
+        
     return deleted_count
 
 
@@ -91,15 +250,20 @@ def get_file_size_mb(filepath):
     Get file size in megabytes.
     
     Args:
-        filepath (str): Path to file
+        filepath (str or os.DirEntry): Path to file, or a scandir entry
+            whose cached stat result is reused
         
     Returns:
         float: File size in MB
     """
-    if not os.path.exists(filepath):
+    try:
+        if isinstance(filepath, os.DirEntry):
+            size_bytes = filepath.stat().st_size
+        else:
+            size_bytes = os.stat(filepath).st_size
+    except FileNotFoundError:
         return 0
         
-    size_bytes = os.path.getsize(filepath)
     return size_bytes / (1024 * 1024)
 
 
@@ -108,18 +272,18 @@ def validate_csv_structure(filepath, required_columns=None):
     Validate that a CSV file has the expected structure.
     
     Args:
-        filepath (str): Path to CSV file
+        filepath (str): Path to CSV file, optionally gzipped (.gz)
         required_columns (list): List of required column names
         
     Returns:
         tuple: (bool, str) - (is_valid, error_message)
     """
     try:
-        # Read just the header
-        df = pd.read_csv(filepath, nrows=0)
+        # Read just the header line; no need for the pandas parser
+        columns = read_csv_header(filepath)
         
         if required_columns:
-            missing_columns = set(required_columns) - set(df.columns)
+            missing_columns = set(required_columns) - set(columns)
             if missing_columns:
                 return False, f"Missing columns: {', '.join(missing_columns)}"
                 
@@ -129,6 +293,289 @@ def validate_csv_structure(filepath, required_columns=None):
         return False, f"Error reading CSV: {str(e)}"
 
 
+
+def read_csv_header(filepath):
+    """
+    Read the column names from the first line of a CSV file.
+    
+    Args:
+        filepath (str): Path to CSV file, optionally gzipped (.gz)
+        
+    Returns:
+        list: Column names (empty for an empty file)
+    """
+    opener = gzip.open if str(filepath).endswith('.gz') else open
+    with opener(filepath, 'rt', newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f), [])
+
+
+def csv_meta(filepath):
+    """
+    Get the column names and data row count of a CSV file.
+    
+    The result is mirrored to a <filepath>.meta.json sidecar and reused
+    while the file's size and mtime are unchanged, so the full scan only
+    happens once per download.
+    
+    Args:
+        filepath (str): Path to CSV file, optionally gzipped (.gz)
+        
+    Returns:
+        dict: {'columns': list, 'row_count': int, 'size': int, 'mtime_ns': int}
+    """
+    filepath = str(filepath)
+    stat = os.stat(filepath)
+    cache = filepath + '.meta.json'
+    
+    try:
+        meta = _read_json(cache)
+        if meta.get('mtime_ns') == stat.st_mtime_ns and meta.get('size') == stat.st_size:
+            return meta
+    except (OSError, ValueError):
+        pass
+        
+    columns = read_csv_header(filepath)
+    row_count = 0
+    if columns:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+        
+        # Convert a single column as plain strings; only the row count matters
+        reader = pacsv.open_csv(
+            filepath,
+            convert_options=pacsv.ConvertOptions(
+                include_columns=columns[:1],
+                column_types={columns[0]: pa.string()}
+            )
+        )
+        row_count = sum(batch.num_rows for batch in reader)
+        
+    meta = {
+        'columns': columns,
+        'row_count': row_count,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+    
+    try:
+        _write_json_atomic(meta, cache)
+    except OSError:
+        # Read-only location: just skip the cache
+        pass
+        
+    return meta
+
+def _arrow_convert_options(filepath, columns, dtypes=None):
+    """
+    Build pyarrow ConvertOptions loading the columns of filepath that exist.
+    
+    Args:
+        filepath (str): Path to CSV file
+        columns (list): Column names to load, or None for every column
+        dtypes (dict): Column dtypes in COLUMN_DTYPES form (default:
+            COLUMN_DTYPES); unlisted columns are inferred
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    
+    header = read_csv_header(filepath)
+    include = header if columns is None else [col for col in columns if col in header]
+    
+    if dtypes is None:
+        dtypes = COLUMN_DTYPES
+    column_types = {}
+    for col in include:
+        dtype = dtypes.get(col)
+        if dtype == 'category':
+            column_types[col] = pa.dictionary(pa.int32(), pa.string())
+        elif dtype is not None:
+            column_types[col] = pa.type_for_alias(dtype)
+            
+    # Empty string fields become nulls, as with pd.read_csv
+    return pacsv.ConvertOptions(
+        include_columns=include,
+        column_types=column_types,
+        strings_can_be_null=True
+    )
+
+
+def read_csv_table(filepath, columns=REQUIRED_COLUMNS, dtypes=None, block_size=8 << 20):
+    """
+    Load the given columns of a CSV file as an Arrow table.
+    
+    Same column handling as read_csv_columns, without the conversion to
+    pandas, for consumers that take Arrow data directly.
+    
+    Args:
+        filepath (str): Path to CSV file (.gz is decompressed transparently)
+        columns (list): Column names to load, or None for every column
+        dtypes (dict): Column dtypes (default: COLUMN_DTYPES)
+        block_size (int): Bytes of CSV per parse task
+        
+    Returns:
+        pyarrow.Table: Loaded data
+    """
+    from pyarrow import csv as pacsv
+    
+    return pacsv.read_csv(
+        filepath,
+        read_options=pacsv.ReadOptions(block_size=block_size),
+        convert_options=_arrow_convert_options(filepath, columns, dtypes)
+    )
+
+
+def read_csv_columns(filepath, columns=REQUIRED_COLUMNS, dtypes=None, block_size=8 << 20):
+    """
+    Load the given columns of a CSV file with pyarrow's multithreaded reader.
+    
+    Columns missing from the file are skipped rather than raising, so
+    callers can report them. Dates are left to pyarrow's ISO-8601 inference
+    and come back as datetime64 when every value parses, unless given a
+    'string' dtype.
+    
+    Args:
+        filepath (str): Path to CSV file (.gz is decompressed transparently)
+        columns (list): Column names to load, or None for every column
+        dtypes (dict): Column dtypes (default: COLUMN_DTYPES); 'category'
+            and 'string' are supported alongside numeric dtype names
+        block_size (int): Bytes of CSV per parse task; larger blocks mean
+            fewer chunks per column for the pandas conversion to stitch
+        
+    Returns:
+        pandas.DataFrame: Loaded data
+    """
+    table = read_csv_table(filepath, columns, dtypes, block_size)
+    # Hand column buffers over to pandas and release the Arrow table as it goes
+    return table.to_pandas(date_as_object=False, split_blocks=True, self_destruct=True)
+
+
+def open_csv_columns(filepath, columns=REQUIRED_COLUMNS, block_size=16 << 20):
+    """
+    Stream the given columns of a CSV file as Arrow record batches.
+    
+    Same column handling as read_csv_columns, but only one block of the
+    file is held in memory at a time. Types of columns without a known
+    dtype are inferred from the first block and then widened so later
+    blocks still convert: integers become float64, and columns that are
+    empty throughout the first block are read as strings.
+    
+    Args:
+        filepath (str): Path to CSV file (.gz is decompressed transparently)
+        columns (list): Column names to load, or None for every column
+        block_size (int): Bytes of CSV parsed per batch
+        
+    Returns:
+        pyarrow.csv.CSVStreamingReader: Iterable of record batches
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    
+    read_options = pacsv.ReadOptions(block_size=block_size)
+    convert_options = _arrow_convert_options(filepath, columns)
+    
+    # Opening the reader parses the first block to fix the schema
+    schema = pacsv.open_csv(filepath, read_options=read_options, convert_options=convert_options).schema
+    column_types = dict(convert_options.column_types)
+    for field in schema:
+        if field.name in column_types:
+            continue
+        if pa.types.is_null(field.type):
+            column_types[field.name] = pa.string()
+        elif pa.types.is_integer(field.type):
+            column_types[field.name] = pa.float64()
+    convert_options.column_types = column_types
+    
+    return pacsv.open_csv(filepath, read_options=read_options, convert_options=convert_options)
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_counts_kernel():
+    """
+    Build the fused count-scan kernel.
+    
+    With Numba, the kernel has an explicit signature, so it is compiled here
+    (and, with cache=True, loaded from the on-disk cache on later runs) rather
+    than on its first call; columns are scanned in parallel. Input must be a
+    Fortran-ordered float64 array so each column is contiguous. Without
+    Numba, an equivalent NumPy implementation is returned.
+    
+    Returns:
+        callable: 2-D float64 array -> (non-NaN, negative, sum) per column
+    """
+    import numpy as np
+    
+    try:
+        from numba import njit, prange
+    except ImportError:
+        def numpy_kernel(values):
+            """NumPy fallback for the fused count scan when Numba is unavailable."""
+            valid = (~np.isnan(values)).sum(axis=0)
+            negative = (values < 0).sum(axis=0)
+            total = np.nansum(values, axis=0)
+            return valid, negative, total
+        return numpy_kernel
+        
+    @njit('Tuple((int64[::1], int64[::1], float64[::1]))(float64[::1, :])', cache=True, parallel=True)
+    def kernel(values):
+        """Fused pass over a 2-D float array: non-NaN, negative and sum per column."""
+        n_rows, n_cols = values.shape
+        valid = np.zeros(n_cols, dtype=np.int64)
+        negative = np.zeros(n_cols, dtype=np.int64)
+        total = np.zeros(n_cols, dtype=np.float64)
+        for j in prange(n_cols):
+            col_valid = 0
+            col_negative = 0
+            col_total = 0.0
+            for i in range(n_rows):
+                x = values[i, j]
+                if x == x:
+                    col_valid += 1
+                    col_total += x
+                    if x < 0:
+                        col_negative += 1
+            valid[j] = col_valid
+            negative[j] = col_negative
+            total[j] = col_total
+        return valid, negative, total
+    return kernel
+
+
+def warm_scan_counts():
+    """
+    Compile (or load from Numba's cache) the scan_counts kernel up front.
+    
+    Call at import time in modules that use scan_counts so the first scan
+    does not pay for compilation.
+    """
+    _scan_counts_kernel()
+
+
+def scan_counts(df, columns):
+    """
+    Scan numeric count columns in a single pass.
+    
+    Args:
+        df (pandas.DataFrame): Data to scan
+        columns (list): Numeric column names
+        
+    Returns:
+        dict: Per column, {'count': non-null values, 'negative': values < 0,
+            'mean': mean of non-null values (NaN if none)}
+    """
+    import numpy as np
+    
+    values = np.asfortranarray(df[columns].to_numpy(dtype=np.float64))
+    valid, negative, total = _scan_counts_kernel()(values)
+    
+    return {
+        col: {
+            'count': int(valid[i]),
+            'negative': int(negative[i]),
+            'mean': float(total[i] / valid[i]) if valid[i] else float('nan'),
+        }
+        for i, col in enumerate(columns)
+    }
+
 def format_duration(seconds):
     """
     Format duration in seconds to human-readable string.
@@ -159,18 +606,25 @@ def create_data_summary(df):
     Returns:
         dict: Summary statistics
     """
+    import pandas as pd
+    
+    # Deep sizing walks every Python string cell, which only object columns
+    # need; numeric, categorical and Arrow-backed columns size exactly without it
+    deep = (df.dtypes == object).any()
     summary = {
         'row_count': len(df),
         'column_count': len(df.columns),
-        'memory_usage_mb': df.memory_usage(deep=True).sum() / (1024 * 1024),
-        'null_counts': df.isnull().sum().to_dict(),
+        'memory_usage_mb': df.memory_usage(deep=deep).sum() / (1024 * 1024),
+        'null_counts': dict(zip(df.columns, df.isna().values.sum(axis=0).tolist())),
         'dtypes': df.dtypes.astype(str).to_dict(),
     }
     
     # Add date range if date column exists
     if 'date' in df.columns:
         try:
-            df['date'] = pd.to_datetime(df['date'])
+            # OWID dates are always YYYY-MM-DD; an explicit format uses the
+            # vectorized parser instead of per-element inference
+            df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d', errors='coerce')
             summary['date_range'] = {
                 'start': str(df['date'].min()),
                 'end': str(df['date'].max())
@@ -189,15 +643,31 @@ def export_summary_to_txt(summary, output_path):
         summary (dict): Summary dictionary
         output_path (str): Output file path
     """
+    lines = ["COVID-19 Data Summary", "=" * 60, ""]
+    lines.extend(f"{key}: {value}" for key, value in summary.items())
+    lines.extend(["", "=" * 60, f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ""])
+    
     with open(output_path, 'w') as f:
-        f.write("COVID-19 Data Summary\n")
-        f.write("=" * 60 + "\n\n")
+        f.write("\n".join(lines))
+
+
+def export_summary_to_json(summary, output_path):
+    """
+    Export data summary to a JSON file.
+    
+    Uses orjson when it is installed, which serializes NumPy scalars from
+    create_data_summary natively; otherwise they are converted with item().
+    
+    Args:
+        summary (dict): Summary dictionary
+        output_path (str): Output file path
+    """
+    if orjson is not None:
+        data = orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        data = json.dumps(summary, indent=2, default=lambda value: value.item()).encode('utf-8')
         
-        for key, value in summary.items():
-            f.write(f"{key}: {value}\n")
-            
-        f.write("\n" + "=" * 60 + "\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    Path(output_path).write_bytes(data)
 
 
 if __name__ == "__main__":
@@ -206,6 +676,7 @@ if __name__ == "__main__":
     
     # Test cleanup
     print(f"Latest file in data/raw: {get_latest_file('data/raw')}")
+    print(f"Latest file in data/validated: {get_latest_file('data/validated', '*.parquet')}")
     
     # Test duration formatting
     print(f"45 seconds: {format_duration(45)}")